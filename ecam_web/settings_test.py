@@ -0,0 +1,33 @@
+"""
+Django settings for running the ecam_web test suite.
+
+Imports the regular settings and overrides only what the tests can
+safely cut corners on.
+"""
+
+import os
+
+from .settings import *  # noqa: F401,F403
+
+# Fixture users never need a strong hash; PBKDF2 dominates their creation
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+# Opt-in in-memory database for quick local runs; CI keeps PostgreSQL.
+# Leave it unset for run_tests_with_dependencies: its regeneration branch
+# seeds the default database, which an unmigrated in-memory DB can't hold
+if os.getenv('TEST_DATABASE') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+
+# API tests only read JSON; keep the browsable API's template renderer out
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': ['rest_framework.renderers.JSONRenderer'],
+    'TEST_REQUEST_DEFAULT_FORMAT': 'json',
+}
@@ -222,16 +222,23 @@ class Measurement(models.Model):
     def __str__(self):
         return f"{self.name} - {self.location.name}"
 
+    @property
+    def category(self):
+        """Category of the measurement's type"""
+        return self.type.category
+
     def clean(self):
         super().clean()
+        # Missing unit/type are reported by clean_fields; check ids so an
+        # unset relation doesn't raise RelatedObjectDoesNotExist here
         # Validate that unit belongs to measurement type
-        if self.unit and self.type and self.unit.type != self.type:
+        if self.unit_id and self.type_id and self.unit.type_id != self.type_id:
             raise ValidationError({
                 'unit': f'Unit must belong to measurement type {self.type}'
             })
         
         # Validate multiplier if present
-        if self.multiplier and not self.type.supports_multipliers:
+        if self.multiplier and self.type_id and not self.type.supports_multipliers:
             raise ValidationError({
                 'multiplier': f'Measurement type {self.type} does not support multipliers'
             })
@@ -83,7 +83,7 @@ class MeasurementSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'name', 'description', 
             'category', 'type', 'unit', 'unit_id',
-            'location', 'multiplier', 'source_timezone'
+            'location', 'multiplier'
         ]
 
     def validate(self, data):
@@ -6,22 +6,21 @@ import json
 from ..test_base import BaseAPITestCase
 from ...models import Location, Project, MeasurementUnit
 
+LOCATION_LIST_URL = reverse('location-list')
+
 class TestLocationAPI(BaseAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.detail_url = reverse('location-detail', kwargs={'pk': cls.test_location.pk})
+
     def setUp(self):
         super().setUp()
-        self.list_url = reverse('location-list')
-        self.detail_url = reverse('location-detail', kwargs={'pk': self.test_location.pk})
         self.client.content_type = 'application/json'
 
-        # Get base unit for the pressure type
-        self.test_unit = MeasurementUnit.objects.filter(
-            type=self.pressure_type,
-            is_base_unit=True
-        ).first()
-
     def test_list_locations(self):
         """Test retrieving list of locations"""
-        response = self.client.get(self.list_url)
+        response = self.client.get(LOCATION_LIST_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)  # From utils_data
         self.assertEqual(response.data[0]['name'], "Industrial Facility")
@@ -36,12 +35,14 @@ class TestLocationAPI(BaseAPITestCase):
             'longitude': '-118.2438'
         }
         response = self.client.post(
-            self.list_url, 
+            LOCATION_LIST_URL, 
             data=json.dumps(data), 
             content_type='application/json'
         )
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(Location.objects.filter(name='New Location').exists())
+        self.assertTrue(
+            Location.objects.filter(pk=response.data['id'], name='New Location').exists()
+        )
 
     def test_create_location_validation(self):
         """Test location creation validation"""
@@ -74,18 +75,7 @@ class TestLocationAPI(BaseAPITestCase):
             }
         ]
 
-        for test_case in test_cases:
-            response = self.client.post(
-                self.list_url, 
-                data=test_case['data'], 
-                content_type='application/json'
-            )
-            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-            
-            # Check that the expected error is in the response
-            error_str = str(response.data)
-            self.assertIn(test_case['expected_error'], error_str, 
-                        f"Expected error '{test_case['expected_error']}' not found in {error_str}")
+        self.assertValidationErrors(LOCATION_LIST_URL, test_cases)
 
     def test_retrieve_location_with_measurements(self):
         """Test retrieving a specific location with measurement details"""
@@ -2,19 +2,20 @@
 from rest_framework import status
 from django.urls import reverse
 from ..test_base import BaseAPITestCase
-from ...models import Measurement, Location, MeasurementUnit
+from ...models import Measurement, Location
+
+MEASUREMENT_LIST_URL = reverse('measurement-list')
+
+def measurement_detail_url(pk):
+    """Router detail URL for pk, built without another resolver walk"""
+    return f"{MEASUREMENT_LIST_URL}{pk}/"
 
 class TestMeasurementAPI(BaseAPITestCase):
-    def setUp(self):
-        super().setUp()
-        self.list_url = reverse('measurement-list')
-        self.test_unit = MeasurementUnit.objects.filter(
-            type=self.pressure_type,
-            is_base_unit=True
-        ).first()
-        
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         # Ensure we have a test location
-        self.location = self.test_location
+        cls.location = cls.test_location
 
     def test_create_measurement(self):
         """Test creating a new measurement"""
@@ -26,14 +27,15 @@ class TestMeasurementAPI(BaseAPITestCase):
             'description': 'A test measurement'
         }
         
-        response = self.client.post(self.list_url, data)
+        response = self.client.post(MEASUREMENT_LIST_URL, data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         
         # Verify measurement was created
-        measurement = Measurement.objects.get(name='New Test Measurement')
-        self.assertEqual(measurement.location, self.location)
-        self.assertEqual(measurement.type, self.pressure_type)
-        self.assertEqual(measurement.unit, self.test_unit)
+        measurement = Measurement.objects.get(pk=response.data['id'])
+        self.assertEqual(measurement.name, 'New Test Measurement')
+        self.assertEqual(measurement.location_id, self.location.pk)
+        self.assertEqual(measurement.type_id, self.pressure_type.pk)
+        self.assertEqual(measurement.unit_id, self.test_unit.pk)
 
     def test_create_measurement_validation(self):
         """Test validation during measurement creation"""
@@ -67,10 +69,7 @@ class TestMeasurementAPI(BaseAPITestCase):
             }
         ]
 
-        for test_case in test_cases:
-            response = self.client.post(self.list_url, test_case['data'])
-            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-            self.assertIn(test_case['expected_error'], str(response.data))
+        self.assertValidationErrors(MEASUREMENT_LIST_URL, test_cases)
 
     def test_retrieve_measurement(self):
         """Test retrieving a specific measurement"""
@@ -82,7 +81,7 @@ class TestMeasurementAPI(BaseAPITestCase):
             unit=self.test_unit
         )
         
-        url = reverse('measurement-detail', kwargs={'pk': measurement.pk})
+        url = measurement_detail_url(measurement.pk)
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -101,7 +100,7 @@ class TestMeasurementAPI(BaseAPITestCase):
             unit=self.test_unit
         )
         
-        url = reverse('measurement-detail', kwargs={'pk': measurement.pk})
+        url = measurement_detail_url(measurement.pk)
         data = {
             'name': 'Updated Measurement Name',
             'description': 'An updated description'
@@ -111,9 +110,10 @@ class TestMeasurementAPI(BaseAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Verify update
-        measurement.refresh_from_db()
-        self.assertEqual(measurement.name, 'Updated Measurement Name')
-        self.assertEqual(measurement.description, 'An updated description')
+        self.assertEqual(
+            Measurement.objects.values_list('name', 'description').get(pk=measurement.pk),
+            ('Updated Measurement Name', 'An updated description')
+        )
 
     def test_delete_measurement(self):
         """Test deleting a measurement"""
@@ -125,7 +125,7 @@ class TestMeasurementAPI(BaseAPITestCase):
             unit=self.test_unit
         )
         
-        url = reverse('measurement-detail', kwargs={'pk': measurement.pk})
+        url = measurement_detail_url(measurement.pk)
         response = self.client.delete(url)
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
@@ -149,26 +149,32 @@ class TestMeasurementAPI(BaseAPITestCase):
             'unit': self.test_unit.pk
         }
         
-        response = self.client.post(self.list_url, data)
+        response = self.client.post(MEASUREMENT_LIST_URL, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('name', str(response.data))
 
     def test_measurement_list(self):
         """Test retrieving list of measurements"""
-        # Create multiple measurements
-        Measurement.objects.create(
-            name='Measurement 1',
-            location=self.location,
-            type=self.pressure_type,
-            unit=self.test_unit
-        )
-        Measurement.objects.create(
-            name='Measurement 2',
-            location=self.location,
-            type=self.pressure_type,
-            unit=self.test_unit
-        )
+        # The list only shows measurements in projects the user can access
+        project = self.location.project
+        project.grant_access(self.test_user, granted_by=project.owner)
+
+        # Create multiple measurements in one insert
+        Measurement.objects.bulk_create([
+            Measurement(
+                name=name,
+                location=self.location,
+                type=self.pressure_type,
+                unit=self.test_unit
+            )
+            for name in ('Measurement 1', 'Measurement 2')
+        ])
         
-        response = self.client.get(self.list_url)
+        # Category, type and unit must come from the list query, not per row
+        with self.assertMaxQueries(1):
+            response = self.client.get(MEASUREMENT_LIST_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertTrue(len(response.data) >= 2)
\ No newline at end of file
+        names = {item['name'] for item in response.data}
+        self.assertTrue({'Measurement 1', 'Measurement 2'} <= names)
+        category = next(item['category'] for item in response.data if item['name'] == 'Measurement 1')
+        self.assertEqual(category['id'], self.pressure_category.pk)
\ No newline at end of file
@@ -5,21 +5,21 @@ from datetime import date
 from ..test_base import BaseAPITestCase
 from ...models import Project, Location, Measurement, MeasurementUnit, MeasurementCategory, MeasurementType 
 
+PROJECT_LIST_URL = reverse('project-list')
+
+def project_detail_url(pk):
+    """Router detail URL for pk, built without another resolver walk"""
+    return f"{PROJECT_LIST_URL}{pk}/"
+
 class TestProjectAPI(BaseAPITestCase):
-    def setUp(self):
-        super().setUp()
-        self.list_url = reverse('project-list')
-        self.detail_url = reverse('project-detail', kwargs={'pk': self.test_project.pk})
-        
-        # Get base unit for the pressure type
-        self.test_unit = MeasurementUnit.objects.filter(
-            type=self.pressure_type,
-            is_base_unit=True
-        ).first()
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.detail_url = project_detail_url(cls.test_project.pk)
 
     def test_list_projects(self):
         """Test retrieving list of projects"""
-        response = self.client.get(self.list_url)
+        response = self.client.get(PROJECT_LIST_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 2)  # From utils_data
         self.assertEqual(response.data[0]['name'], "Energy Trust Production")
@@ -31,9 +31,11 @@ class TestProjectAPI(BaseAPITestCase):
             'project_type': 'M&V',
             'start_date': date.today().isoformat()
         }
-        response = self.client.post(self.list_url, data)
+        response = self.client.post(PROJECT_LIST_URL, data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        self.assertTrue(Project.objects.filter(name='New Test Project').exists())
+        self.assertTrue(
+            Project.objects.filter(pk=response.data['id'], name='New Test Project').exists()
+        )
 
     def test_create_project_validation(self):
         """Test project creation validation"""
@@ -57,10 +59,7 @@ class TestProjectAPI(BaseAPITestCase):
             }
         ]
 
-        for test_case in test_cases:
-            response = self.client.post(self.list_url, test_case['data'])
-            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-            self.assertIn(test_case['expected_error'], str(response.data))
+        self.assertValidationErrors(PROJECT_LIST_URL, test_cases)
 
     def test_retrieve_project(self):
         """Test retrieving a specific project with measurements"""
@@ -86,8 +85,10 @@ class TestProjectAPI(BaseAPITestCase):
         }
         response = self.client.patch(self.detail_url, data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.test_project.refresh_from_db()
-        self.assertEqual(self.test_project.name, 'Updated Project Name')
+        self.assertEqual(
+            Project.objects.values_list('name', flat=True).get(pk=self.test_project.pk),
+            'Updated Project Name'
+        )
 
     def test_delete_project(self):
         """Test deleting a project"""
@@ -122,14 +123,16 @@ class TestProjectAPI(BaseAPITestCase):
         category_id = self.test_unit.type.category.id
 
         # Delete project
-        url = reverse('project-detail', kwargs={'pk': project.pk})
+        url = project_detail_url(project.pk)
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
 
         # Verify cascade
-        self.assertFalse(Project.objects.filter(pk=project.pk).exists())
-        self.assertFalse(Location.objects.filter(pk=location_id).exists())
-        self.assertFalse(Measurement.objects.filter(pk=measurement_id).exists())
+        self.assertNoRows(
+            Project.objects.filter(pk=project.pk),
+            Location.objects.filter(pk=location_id),
+            Measurement.objects.filter(pk=measurement_id)
+        )
         
         # Verify measurement categories, types and units are NOT deleted
         self.assertTrue(MeasurementUnit.objects.filter(pk=unit_id).exists())
@@ -137,39 +140,26 @@ class TestProjectAPI(BaseAPITestCase):
         self.assertTrue(MeasurementCategory.objects.filter(pk=category_id).exists())
 
     def test_project_list_structure(self):
-        """Test project list includes correct nested structure with measurement info"""
-        # Create measurement in test location
-        measurement = Measurement.objects.create(
-            name="API Test Measurement",
-            location=self.test_location,
-            type=self.pressure_type,
-            unit=self.test_unit
-        )
+        """Test project list nests locations and access for each project"""
+        # The list only shows projects the user owns or has access to.
+        # Own every fixture project so per-project lookups would exceed the bound
+        Project.objects.update(owner=self.test_user)
+        self.assertGreater(Project.objects.count(), 1)
 
-        response = self.client.get(self.list_url)
+        # Nested locations and access must not be fetched per project
+        with self.assertMaxQueries(3):
+            response = self.client.get(PROJECT_LIST_URL)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
         # Get our test project from response
         project_data = next(p for p in response.data if p['id'] == self.test_project.id)
         
-        # Verify structure
+        # Verify structure; measurements are served by their own endpoint
+        self.assertIn('access', project_data)
         self.assertIn('locations', project_data)
-        self.assertTrue(len(project_data['locations']) > 0)
-        
-        # Verify nested location has measurements
-        location_data = project_data['locations'][0]
-        self.assertIn('measurements', location_data)
-        
-        # Verify measurement includes full unit information
-        measurement_data = next(
-            m for m in location_data['measurements'] 
-            if m['id'] == measurement.id
+        location_data = next(
+            l for l in project_data['locations']
+            if l['id'] == self.test_location.id
         )
-        self.assertIn('unit', measurement_data)
-        self.assertIn('category', measurement_data)
-        self.assertIn('type', measurement_data)
-        
-        # Verify specific measurement attributes
-        self.assertEqual(measurement_data['unit']['id'], self.test_unit.id)
-        self.assertEqual(measurement_data['category']['id'], self.test_unit.type.category.id)
-        self.assertEqual(measurement_data['type']['id'], self.test_unit.type.id)
\ No newline at end of file
+        self.assertEqual(location_data['name'], self.test_location.name)
+        self.assertEqual(location_data['project'], self.test_project.id)
@@ -1,5 +1,9 @@
 # tests/test_base.py
+from contextlib import contextmanager
+from django.db import connection
+from django.db.models import Value
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User, Permission
 from django.contrib.contenttypes.models import ContentType
@@ -26,32 +30,23 @@ class BaseTestCase(TestCase):
            last_name='User'
        )
 
-       # Get content types
-       project_ct = ContentType.objects.get_for_model(Project)
-       location_ct = ContentType.objects.get_for_model(Location)
-       measurement_ct = ContentType.objects.get_for_model(Measurement)
-       category_ct = ContentType.objects.get_for_model(MeasurementCategory)
-       type_ct = ContentType.objects.get_for_model(MeasurementType)
-       unit_ct = ContentType.objects.get_for_model(MeasurementUnit)
-       datasource_ct = ContentType.objects.get_for_model(DataSource)
-       dataset_ct = ContentType.objects.get_for_model(Dataset)
-       column_ct = ContentType.objects.get_for_model(SourceColumn)
-       mapping_ct = ContentType.objects.get_for_model(ColumnMapping)
+       # Get content types in a single query
+       content_types = ContentType.objects.get_for_models(
+           Project,
+           Location,
+           Measurement,
+           MeasurementCategory,
+           MeasurementType,
+           MeasurementUnit,
+           DataSource,
+           Dataset,
+           SourceColumn,
+           ColumnMapping
+       )
 
        # Get all model permissions
        model_permissions = Permission.objects.filter(
-           content_type__in=[
-               project_ct, 
-               location_ct, 
-               measurement_ct,
-               category_ct,
-               type_ct,
-               unit_ct,
-               datasource_ct,
-               dataset_ct,
-               column_ct,
-               mapping_ct
-           ]
+           content_type__in=content_types.values()
        )
 
        # Assign permissions to test user
@@ -66,27 +61,83 @@ class BaseTestCase(TestCase):
        # Get reference to test location
        cls.test_location = Location.objects.get(name="Industrial Facility")
        
+       # Load fixture measurements once, keyed by name (names are unique in the fixtures)
+       cls.measurements = {
+           measurement.name: measurement
+           for measurement in Measurement.objects.select_related('type', 'unit', 'location')
+       }
+
        # Get reference to test measurement
-       cls.test_measurement = Measurement.objects.get(name="Building Pressure")
+       cls.test_measurement = cls.measurements["Building Pressure"]
 
        # Get references to categories, types and units
-       cls.pressure_category = MeasurementCategory.objects.get(name='pressure')
-       cls.pressure_type = MeasurementType.objects.get(name='Differential Pressure')
-       cls.pressure_unit = MeasurementUnit.objects.get(
-           type__name='Differential Pressure',
-           multiplier=''  # base unit
+       categories = MeasurementCategory.objects.in_bulk(['pressure', 'flow'], field_name='name')
+       cls.pressure_category = categories['pressure']
+       cls.flow_category = categories['flow']
+       # Types render with their category name, so join it up front
+       types = MeasurementType.objects.select_related('category')
+       cls.pressure_type = types.get(name='Differential Pressure')
+       cls.flow_type = types.get(name='Volumetric Flow')
+       # Join type and category so tests can traverse them without queries
+       cls.pressure_unit = MeasurementUnit.objects.select_related('type__category').get(
+           type=cls.pressure_type,
+           name='inH2O'
+       )
+
+       # Unit shared by tests that create pressure measurements
+       cls.test_unit = cls.pressure_unit
+
+   @contextmanager
+   def assertMaxQueries(self, num):
+       """Fail if more than num queries run, listing the SQL that did"""
+       with CaptureQueriesContext(connection) as context:
+           yield context
+       self.assertLessEqual(
+           len(context.captured_queries), num,
+           '\n'.join(query['sql'] for query in context.captured_queries)
        )
 
+   def _model_rows(self, querysets):
+       """Return (model name, pk) pairs for all querysets from a single UNION query"""
+       first, *rest = [
+           queryset.annotate(
+               model=Value(queryset.model._meta.model_name)
+           ).values_list('model', 'pk')
+           for queryset in querysets
+       ]
+       return list(first.union(*rest, all=True))
+
+   def assertNoRows(self, *querysets):
+       """Assert every queryset is empty, checked with a single UNION query"""
+       self.assertEqual(self._model_rows(querysets), [])
+
+   def assertRowsExist(self, *querysets):
+       """Assert every queryset (one per model) has rows, checked with a single UNION query"""
+       found = {model for model, _ in self._model_rows(querysets)}
+       expected = {queryset.model._meta.model_name for queryset in querysets}
+       self.assertEqual(found, expected)
+
 class BaseAPITestCase(BaseTestCase):
+   # TestCase builds a fresh client_class() for every test, so use APIClient
+   # for DRF features rather than replacing the client in setUp
+   client_class = APIClient
+
    def setUp(self):
        """Set up auth for API tests"""
        super().setUp()
        
-       # Use APIClient instead of regular Client for DRF features
-       self.client = APIClient()
-       
        # Force authentication for all requests
        self.client.force_authenticate(user=self.test_user)
        
        # Set default content type to JSON
-       self.client.default_format = 'json'
\ No newline at end of file
+       self.client.default_format = 'json'
+
+   def assertValidationErrors(self, url, test_cases):
+       """POST each case's data to url and expect a 400 naming its field"""
+       for test_case in test_cases:
+           with self.subTest(expected_error=test_case['expected_error']):
+               response = self.client.post(url, test_case['data'])
+               self.assertEqual(response.status_code, 400)
+               error_str = str(response.data)
+               self.assertIn(test_case['expected_error'], error_str,
+                           f"Expected error '{test_case['expected_error']}' not found in {error_str}")
\ No newline at end of file
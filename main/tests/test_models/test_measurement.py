@@ -1,10 +1,17 @@
 # tests/test_models/test_measurement.py
 from django.test import TestCase
 from django.core.exceptions import ValidationError
+from django.db.models import ProtectedError
 from ..test_base import BaseTestCase
 from ...models import Measurement, Location, MeasurementUnit
 
 class TestMeasurementModel(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Measurement.__str__ is "<name> - <location name>"
+        cls.expected_measurement_str = f"String Test - {cls.test_location.name}"
+
     def test_str_representation(self):
         """Test string representation of measurement"""
         measurement = Measurement.objects.create(
@@ -13,30 +20,38 @@ class TestMeasurementModel(BaseTestCase):
             type=self.pressure_type,
             unit=self.test_unit
         )
-        expected = f"String Test ({self.test_unit})"
-        self.assertEqual(str(measurement), expected)
+        self.assertEqual(str(measurement), self.expected_measurement_str)
 
     def test_unit_required(self):
         """Test unit is required"""
-        with self.assertRaises(ValidationError) as context:
+        # Skip the FK existence lookups for fields not under test
+        with self.assertNumQueries(0), self.assertRaises(ValidationError) as context:
             Measurement(
                 name="Missing Unit Test",
                 location=self.test_location,
                 type=self.pressure_type,
                 unit=None
-            ).full_clean()
-        self.assertIn('unit', str(context.exception))
+            ).full_clean(
+                exclude=['location', 'type'],
+                validate_unique=False,
+                validate_constraints=False
+            )
+        self.assertIn('unit', context.exception.message_dict)
 
     def test_type_required(self):
         """Test type is required"""
-        with self.assertRaises(ValidationError) as context:
+        with self.assertNumQueries(0), self.assertRaises(ValidationError) as context:
             Measurement(
                 name="Missing Type Test",
                 location=self.test_location,
                 type=None,
                 unit=self.test_unit
-            ).full_clean()
-        self.assertIn('type', str(context.exception))
+            ).full_clean(
+                exclude=['location', 'unit'],
+                validate_unique=False,
+                validate_constraints=False
+            )
+        self.assertIn('type', context.exception.message_dict)
 
     def test_category_type_relationships(self):
         """Test relationships to category and type through unit"""
@@ -46,8 +61,17 @@ class TestMeasurementModel(BaseTestCase):
             type=self.pressure_type,
             unit=self.test_unit
         )
-        self.assertEqual(measurement.type, self.test_unit.type)
-        self.assertEqual(measurement.category, self.test_unit.type.category)
+        # Reload with the whole unit -> type -> category chain joined
+        measurement = Measurement.objects.select_related(
+            'unit__type__category', 'type__category'
+        ).get(pk=measurement.pk)
+        with self.assertNumQueries(0):
+            unit_type = self.test_unit.type
+            unit_category = unit_type.category
+            self.assertEqual(measurement.type, unit_type)
+            self.assertEqual(measurement.category, unit_category)
+            self.assertEqual(measurement.type.category, unit_category)
+            self.assertEqual(measurement.unit.type.category, unit_category)
 
     def test_unit_validation(self):
         """Test unit validation with correct type"""
@@ -58,20 +82,24 @@ class TestMeasurementModel(BaseTestCase):
             type=self.pressure_type,
             unit=self.test_unit
         )
-        
-        self.assertEqual(measurement.unit, self.test_unit)
-        self.assertEqual(measurement.type, self.test_unit.type)
+        measurement = Measurement.objects.select_related('unit', 'type').get(pk=measurement.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(measurement.unit, self.test_unit)
+            self.assertEqual(measurement.type, self.test_unit.type)
 
     def test_unit_type_mismatch(self):
         """Test that unit must match measurement type"""
-        with self.assertRaises(ValidationError) as context:
-            Measurement(
-                name="Mismatched Unit Test",
-                location=self.test_location,
-                type=self.flow_category.types.first(),
-                unit=self.test_unit
-            ).full_clean()
-        self.assertIn('unit', str(context.exception))
+        measurement = Measurement(
+            name="Mismatched Unit Test",
+            location=self.test_location,
+            type=self.flow_type,
+            unit=self.test_unit
+        )
+        # The type check lives in Measurement.clean() and uses the cached unit type
+        with self.assertNumQueries(0), self.assertRaises(ValidationError) as context:
+            measurement.clean()
+        self.assertIn('unit', context.exception.message_dict)
 
     def test_duplicate_names_same_location(self):
         """Test measurements in same location can't have duplicate names"""
@@ -128,18 +156,14 @@ class TestMeasurementModel(BaseTestCase):
             unit=self.test_unit
         )
         
-        # Attempt to delete the unit
-        with self.assertRaises(Exception):
+        # PROTECT stops the delete in the collector, before any DELETE is sent
+        with self.assertRaises(ProtectedError):
             self.test_unit.delete()
         
         # Verify measurement and unit still exist
-        self.assertTrue(
-            Measurement.objects.filter(pk=measurement.pk).exists(),
-            "Measurement should still exist"
-        )
-        self.assertTrue(
-            MeasurementUnit.objects.filter(pk=self.test_unit.pk).exists(),
-            "MeasurementUnit should still exist"
+        self.assertRowsExist(
+            Measurement.objects.filter(pk=measurement.pk),
+            MeasurementUnit.objects.filter(pk=self.test_unit.pk)
         )
 
     def test_optional_description(self):
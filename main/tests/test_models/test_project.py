@@ -6,11 +6,15 @@ from ..test_base import BaseTestCase
 from ...models import Project, Location, Measurement, MeasurementUnit
 
 class TestProjectModel(BaseTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        project = cls.test_project
+        cls.expected_project_str = f"{project.name} ({project.get_project_type_display()})"
+
     def test_str_representation(self):
         """Test string representation of project"""
-        project = Project.objects.get(name="Energy Trust Production")
-        expected = f"{project.name} ({project.get_project_type_display()})"
-        self.assertEqual(str(project), expected)
+        self.assertEqual(str(self.test_project), self.expected_project_str)
 
     def test_project_validation(self):
         """Test project basic validation"""
@@ -25,39 +29,50 @@ class TestProjectModel(BaseTestCase):
 
     def test_invalid_project_type(self):
         """Test project type validation"""
-        with self.assertRaises(ValidationError) as context:
-            Project(
-                name="Invalid Type Test",
-                project_type="InvalidType",
-                start_date=date.today()
-            ).full_clean()
-        self.assertIn('project_type', str(context.exception))
+        # Only the choices check matters; skip validating every other field
+        project_type_field = Project._meta.get_field('project_type')
+        with self.assertNumQueries(0), self.assertRaises(ValidationError) as context:
+            project_type_field.clean("InvalidType", None)
+        self.assertEqual(context.exception.code, 'invalid_choice')
 
     def test_valid_project_types(self):
         """Test all valid project types are accepted"""
-        for project_type, _ in Project.PROJECT_TYPES:
-            project = Project(
-                name=f"Project {project_type}",
-                project_type=project_type,
-                start_date=date.today()
-            )
-            try:
-                project.full_clean()
-                project.save()
-            except ValidationError as e:
-                self.fail(f"Project type {project_type} should be valid but raised: {e}")
+        for project_type in Project.ProjectType.values:
+            with self.subTest(project_type=project_type):
+                project = Project(
+                    name=f"Project {project_type}",
+                    project_type=project_type,
+                    start_date=date.today(),
+                    owner=self.test_user
+                )
+                try:
+                    project.full_clean(validate_unique=False)
+                except ValidationError as e:
+                    self.fail(f"Project type {project_type} should be valid but raised: {e}")
+
+        # A value outside the choices is rejected on project_type
+        project = Project(
+            name="Invalid Type Project",
+            project_type="InvalidType",
+            start_date=date.today(),
+            owner=self.test_user
+        )
+        with self.assertRaises(ValidationError) as context:
+            project.full_clean(validate_unique=False)
+        self.assertIn('project_type', context.exception.message_dict)
 
     def test_date_validation(self):
         """Test start/end date validation"""
         start_date = date.today()
-        with self.assertRaises(ValidationError) as context:
+        # The date ordering check lives in Project.clean()
+        with self.assertNumQueries(0), self.assertRaises(ValidationError) as context:
             Project(
                 name="Invalid Dates Test",
                 project_type="Audit",
                 start_date=start_date,
                 end_date=start_date - timedelta(days=1)  # End before start
-            ).full_clean()
-        self.assertIn('end_date', str(context.exception))
+            ).clean()
+        self.assertIn('end_date', context.exception.message_dict)
 
     def test_valid_date_ranges(self):
         """Test valid date ranges are accepted"""
@@ -69,18 +84,30 @@ class TestProjectModel(BaseTestCase):
             (None, None),  # No dates
         ]
 
-        for start, end in test_ranges:
-            project = Project(
+        projects = [
+            Project(
                 name=f"Project {start}-{end}",
                 project_type="Audit",
                 start_date=start,
-                end_date=end
+                end_date=end,
+                owner=self.test_user
             )
+            for start, end in test_ranges
+        ]
+
+        # Validate in memory; the names are distinct, so skip the uniqueness queries
+        for project in projects:
             try:
-                project.full_clean()
-                project.save()
+                project.full_clean(validate_unique=False)
             except ValidationError as e:
-                self.fail(f"Date range {start} to {end} should be valid but raised: {e}")
+                self.fail(f"Date range {project.start_date} to {project.end_date} should be valid but raised: {e}")
+
+        # Save them all with one INSERT
+        Project.objects.bulk_create(projects)
+        self.assertEqual(
+            Project.objects.filter(name__in=[project.name for project in projects]).count(),
+            len(test_ranges)
+        )
 
     def test_delete_cascade(self):
         """Test deleting project cascades to locations and measurements but preserves units"""
@@ -88,7 +115,8 @@ class TestProjectModel(BaseTestCase):
         project = Project.objects.create(
             name="Cascade Test Project",
             project_type="Audit",
-            start_date=date.today()
+            start_date=date.today(),
+            owner=self.test_user
         )
         
         location = Location.objects.create(
@@ -116,14 +144,18 @@ class TestProjectModel(BaseTestCase):
         project.delete()
         
         # Verify project items are deleted
-        self.assertFalse(Project.objects.filter(id=project_id).exists())
-        self.assertFalse(Location.objects.filter(id=location_id).exists())
-        self.assertFalse(Measurement.objects.filter(id=measurement_id).exists())
+        self.assertNoRows(
+            Project.objects.filter(id=project_id),
+            Location.objects.filter(id=location_id),
+            Measurement.objects.filter(id=measurement_id)
+        )
         
         # Verify measurement hierarchy items are preserved
-        self.assertTrue(MeasurementUnit.objects.filter(id=unit_id).exists())
-        self.assertTrue(self.test_unit.type.__class__.objects.filter(id=type_id).exists())
-        self.assertTrue(self.test_unit.type.category.__class__.objects.filter(id=category_id).exists())
+        self.assertRowsExist(
+            MeasurementUnit.objects.filter(id=unit_id),
+            self.test_unit.type.__class__.objects.filter(id=type_id),
+            self.test_unit.type.category.__class__.objects.filter(id=category_id)
+        )
 
     def test_duplicate_name_allowed(self):
         """Test that projects can have duplicate names"""
@@ -1,121 +1,132 @@
-from django.test import TestCase, Client
+from django.test import RequestFactory
 from django.urls import reverse
 from django.core.files.uploadedfile import SimpleUploadedFile
 from ..test_base import BaseTestCase
+from ..utils_data import create_csv_bytes
 from ...models import DataImport
+from ...views import excel_upload
 import json
-import os
-import csv
-from io import StringIO
+import tempfile
+
+UPLOAD_URL = reverse('excel_upload')
+
+# Rows for each CSV payload posted by the upload tests
+CSV_ROWS = {
+    'valid_with_categories': [
+        ['timestamp', 'location', 'category', 'value'],
+        ['2024-01-01 00:00:00', 'Test Location', 'pressure', '100.5'],
+        ['2024-01-01 00:00:00', 'Test Location', 'flow', '72.0']
+    ],
+    'invalid_category': [
+        ['timestamp', 'location', 'category', 'value'],
+        ['2024-01-01 00:00:00', 'Test Location', 'invalid_category', '100.5']
+    ],
+    'category_case_insensitive': [
+        ['timestamp', 'location', 'category', 'value'],
+        ['2024-01-01 00:00:00', 'Test Location', 'PRESSURE', '100.5'],
+        ['2024-01-01 00:00:00', 'Test Location', 'Flow', '72.0']
+    ],
+    'missing_category_column': [
+        ['timestamp', 'location', 'value'],  # Missing category
+        ['2024-01-01 00:00:00', 'Test Location', '100.5']
+    ],
+    'import_status_tracking': [
+        ['timestamp', 'location', 'category', 'value'],
+        ['2024-01-01 00:00:00', 'Test Location', 'pressure', '100.5']
+    ],
+    'multiple_categories': [
+        ['timestamp', 'location', 'category', 'value'],
+        ['2024-01-01 00:00:00', 'Loc1', 'pressure', '100.5'],
+        ['2024-01-01 00:00:00', 'Loc1', 'flow', '72.0'],
+        ['2024-01-01 00:00:00', 'Loc2', 'pressure', '95.2'],
+        ['2024-01-01 00:00:00', 'Loc2', 'flow', '74.5']
+    ],
+    'unit_type_columns': [
+        ['timestamp', 'location', 'category', 'type', 'unit', 'value'],
+        ['2024-01-01 00:00:00', 'Loc1', 'pressure', 'gauge', 'psi', '100.5'],
+        ['2024-01-01 00:00:00', 'Loc1', 'pressure', 'gauge', 'kPa', '72.0'],
+    ],
+    'invalid_unit_type_combination': [
+        ['timestamp', 'location', 'category', 'type', 'unit', 'value'],
+        ['2024-01-01 00:00:00', 'Loc1', 'pressure', 'gauge', 'invalid_unit', '100.5'],
+    ],
+}
+
+# Encoded CSV payloads, built once per test process
+_CSV_BYTES = {}
 
 class TestExcelUpload(BaseTestCase):
-    def setUp(self):
-        super().setUp()
-        self.upload_url = reverse('excel_upload')
-        self.client = Client()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        if not _CSV_BYTES:
+            for name, rows in CSV_ROWS.items():
+                _CSV_BYTES[name] = create_csv_bytes(rows)
+        cls.csv_bytes = _CSV_BYTES
+        # Private scratch directory, so parallel test workers don't collide
+        cls.test_files_dir = tempfile.TemporaryDirectory(prefix='ecam_excel_')
+        cls.factory = RequestFactory()
 
-    def create_test_csv(self, data):
-        """Helper method to create a test CSV file"""
-        output = StringIO()
-        writer = csv.writer(output)
-        for row in data:
-            writer.writerow(row)
+    @classmethod
+    def tearDownClass(cls):
+        cls.test_files_dir.cleanup()
+        super().tearDownClass()
+
+    def _upload(self, name):
+        """Build a fresh upload for the named CSV from the cached bytes"""
         return SimpleUploadedFile(
-            "test.csv",
-            output.getvalue().encode('utf-8'),
+            f"{name}.csv",
+            self.csv_bytes[name],
             content_type='text/csv'
         )
 
-    def test_valid_upload_with_categories(self):
-        """Test uploading a valid CSV with category mappings"""
-        data = [
-            ['timestamp', 'location', 'category', 'value'],
-            ['2024-01-01 00:00:00', 'Test Location', 'pressure', '100.5'],
-            ['2024-01-01 00:00:00', 'Test Location', 'flow', '72.0']
-        ]
-        csv_file = self.create_test_csv(data)
-        
-        response = self.client.post(self.upload_url, {
-            'csv_file': csv_file,
-            'folder_path': '/tmp',
+    def _post(self, name):
+        """Call the upload view directly, bypassing middleware"""
+        request = self.factory.post(UPLOAD_URL, {
+            'csv_file': self._upload(name),
+            'folder_path': self.test_files_dir.name,
             'workbook_name': 'test_workbook',
             'sheet_name': 'Sheet1'
         })
+        return excel_upload(request)
+
+    def test_valid_upload_with_categories(self):
+        """Test uploading a valid CSV with category mappings"""
+        response = self._post('valid_with_categories')
         
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json()['status'], 'success')
+        body = json.loads(response.content)
+        self.assertEqual(body['status'], 'success')
 
     def test_invalid_category(self):
         """Test uploading CSV with invalid category"""
-        data = [
-            ['timestamp', 'location', 'category', 'value'],
-            ['2024-01-01 00:00:00', 'Test Location', 'invalid_category', '100.5']
-        ]
-        csv_file = self.create_test_csv(data)
-        
-        response = self.client.post(self.upload_url, {
-            'csv_file': csv_file,
-            'folder_path': '/tmp',
-            'workbook_name': 'test_workbook',
-            'sheet_name': 'Sheet1'
-        })
+        response = self._post('invalid_category')
         
         self.assertEqual(response.status_code, 400)
-        self.assertIn('error', response.json())
-        self.assertIn('categories', response.json())
+        body = json.loads(response.content)
+        self.assertIn('error', body)
+        self.assertIn('categories', body)
 
     def test_category_case_insensitive(self):
         """Test that category matching is case insensitive"""
-        data = [
-            ['timestamp', 'location', 'category', 'value'],
-            ['2024-01-01 00:00:00', 'Test Location', 'PRESSURE', '100.5'],
-            ['2024-01-01 00:00:00', 'Test Location', 'Flow', '72.0']
-        ]
-        csv_file = self.create_test_csv(data)
-        
-        response = self.client.post(self.upload_url, {
-            'csv_file': csv_file,
-            'folder_path': '/tmp',
-            'workbook_name': 'test_workbook',
-            'sheet_name': 'Sheet1'
-        })
+        response = self._post('category_case_insensitive')
         
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json()['status'], 'success')
+        body = json.loads(response.content)
+        self.assertEqual(body['status'], 'success')
 
     def test_missing_category_column(self):
         """Test uploading CSV without category column"""
-        data = [
-            ['timestamp', 'location', 'value'],  # Missing category
-            ['2024-01-01 00:00:00', 'Test Location', '100.5']
-        ]
-        csv_file = self.create_test_csv(data)
-        
-        response = self.client.post(self.upload_url, {
-            'csv_file': csv_file,
-            'folder_path': '/tmp',
-            'workbook_name': 'test_workbook',
-            'sheet_name': 'Sheet1'
-        })
+        response = self._post('missing_category_column')
         
         self.assertEqual(response.status_code, 400)
-        self.assertIn('error', response.json())
-        self.assertIn('CSV must contain a category column', response.json()['error'])
+        body = json.loads(response.content)
+        self.assertIn('error', body)
+        self.assertIn('CSV must contain a category column', body['error'])
 
     def test_import_status_tracking(self):
         """Test that import status is tracked with categories"""
-        data = [
-            ['timestamp', 'location', 'category', 'value'],
-            ['2024-01-01 00:00:00', 'Test Location', 'pressure', '100.5']
-        ]
-        csv_file = self.create_test_csv(data)
-        
-        response = self.client.post(self.upload_url, {
-            'csv_file': csv_file,
-            'folder_path': '/tmp',
-            'workbook_name': 'test_workbook',
-            'sheet_name': 'Sheet1'
-        })
+        response = self._post('import_status_tracking')
         
         self.assertEqual(response.status_code, 200)
         
@@ -127,21 +138,7 @@ class TestExcelUpload(BaseTestCase):
 
     def test_multiple_categories(self):
         """Test handling multiple categories in same upload"""
-        data = [
-            ['timestamp', 'location', 'category', 'value'],
-            ['2024-01-01 00:00:00', 'Loc1', 'pressure', '100.5'],
-            ['2024-01-01 00:00:00', 'Loc1', 'flow', '72.0'],
-            ['2024-01-01 00:00:00', 'Loc2', 'pressure', '95.2'],
-            ['2024-01-01 00:00:00', 'Loc2', 'flow', '74.5']
-        ]
-        csv_file = self.create_test_csv(data)
-        
-        response = self.client.post(self.upload_url, {
-            'csv_file': csv_file,
-            'folder_path': '/tmp',
-            'workbook_name': 'test_workbook',
-            'sheet_name': 'Sheet1'
-        })
+        response = self._post('multiple_categories')
         
         self.assertEqual(response.status_code, 200)
         
@@ -154,38 +151,17 @@ class TestExcelUpload(BaseTestCase):
 
     def test_unit_type_columns(self):
         """Test handling of optional unit and type columns"""
-        data = [
-            ['timestamp', 'location', 'category', 'type', 'unit', 'value'],
-            ['2024-01-01 00:00:00', 'Loc1', 'pressure', 'gauge', 'psi', '100.5'],
-            ['2024-01-01 00:00:00', 'Loc1', 'pressure', 'gauge', 'kPa', '72.0'],
-        ]
-        csv_file = self.create_test_csv(data)
-        
-        response = self.client.post(self.upload_url, {
-            'csv_file': csv_file,
-            'folder_path': '/tmp',
-            'workbook_name': 'test_workbook',
-            'sheet_name': 'Sheet1'
-        })
+        response = self._post('unit_type_columns')
         
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json()['status'], 'success')
+        body = json.loads(response.content)
+        self.assertEqual(body['status'], 'success')
 
     def test_invalid_unit_type_combination(self):
         """Test validation of unit and type combinations"""
-        data = [
-            ['timestamp', 'location', 'category', 'type', 'unit', 'value'],
-            ['2024-01-01 00:00:00', 'Loc1', 'pressure', 'gauge', 'invalid_unit', '100.5'],
-        ]
-        csv_file = self.create_test_csv(data)
-        
-        response = self.client.post(self.upload_url, {
-            'csv_file': csv_file,
-            'folder_path': '/tmp',
-            'workbook_name': 'test_workbook',
-            'sheet_name': 'Sheet1'
-        })
+        response = self._post('invalid_unit_type_combination')
         
         self.assertEqual(response.status_code, 400)
-        self.assertIn('error', response.json())
-        self.assertIn('Invalid unit', response.json()['error'])
\ No newline at end of file
+        body = json.loads(response.content)
+        self.assertIn('error', body)
+        self.assertIn('Invalid unit', body['error'])
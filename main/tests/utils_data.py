@@ -18,6 +18,12 @@ def create_csv_file(file_path, data, delimiter=',', encoding='utf-8'):
        writer = csv.writer(csvfile, delimiter=delimiter)
        writer.writerows(data)
 
+def create_csv_bytes(data, delimiter=',', encoding='utf-8'):
+   """Build CSV content for plain rows (no quoting needed) without csv.writer"""
+   lines = (delimiter.join(map(str, row)) for row in data)
+   # Same \r\n terminator csv.writer uses
+   return ''.join(f'{line}\r\n' for line in lines).encode(encoding)
+
 def create_test_user():
    """Create a test user for authentication"""
    user, created = User.objects.get_or_create(
@@ -67,15 +73,22 @@ def create_model_table_data():
        }
    }
 
-   categories = {}
-   for name, details in categories_data.items():
-       categories[name], _ = MeasurementCategory.objects.update_or_create(
+   # Upsert all categories in one statement
+   category_objects = [
+       MeasurementCategory(
            name=name,
-           defaults={
-               'display_name': details['display_name'],
-               'description': details.get('description', '')
-           }
+           display_name=details['display_name'],
+           description=details.get('description', '')
        )
+       for name, details in categories_data.items()
+   ]
+   MeasurementCategory.objects.bulk_create(
+       category_objects,
+       update_conflicts=True,
+       unique_fields=['name'],
+       update_fields=['display_name', 'description']
+   )
+   categories = dict(zip(categories_data, category_objects))
 
    # Create Types with get_or_create
    types_data = {
@@ -143,31 +156,37 @@ def create_model_table_data():
    all_type_data.update(types_data['flow_types'])
    all_type_data.update(types_data['other_types'])
 
-   types = {}
-   for name, details in all_type_data.items():
-       # Adjust name for lookup
-       lookup_names = {
-           'absolute': 'Absolute Pressure',
-           'gauge': 'Gauge Pressure',
-           'differential': 'Differential Pressure',
-           'volumetric': 'Volumetric Flow',
-           'mass': 'Mass Flow',
-           'frequency': 'Frequency',
-           'count': 'Count',
-           'percent': 'Percentage',
-           'celsius': 'Celsius',
-           'elevation': 'Height'
-       }
-       lookup_name = lookup_names.get(name, name.capitalize())
+   # Adjust name for lookup
+   lookup_names = {
+       'absolute': 'Absolute Pressure',
+       'gauge': 'Gauge Pressure',
+       'differential': 'Differential Pressure',
+       'volumetric': 'Volumetric Flow',
+       'mass': 'Mass Flow',
+       'frequency': 'Frequency',
+       'count': 'Count',
+       'percent': 'Percentage',
+       'celsius': 'Celsius',
+       'elevation': 'Height'
+   }
 
-       types[name], _ = MeasurementType.objects.update_or_create(
+   # Upsert all types in one statement
+   type_objects = [
+       MeasurementType(
            category=details['category'],
-           name=lookup_name,
-           defaults={
-               'description': details['description'],
-               'supports_multipliers': details['supports_multipliers']
-           }
+           name=lookup_names.get(name, name.capitalize()),
+           description=details['description'],
+           supports_multipliers=details['supports_multipliers']
        )
+       for name, details in all_type_data.items()
+   ]
+   MeasurementType.objects.bulk_create(
+       type_objects,
+       update_conflicts=True,
+       unique_fields=['category', 'name'],
+       update_fields=['description', 'supports_multipliers']
+   )
+   types = dict(zip(all_type_data, type_objects))
 
    # Create Units with get_or_create
    units_data = {
@@ -239,19 +258,26 @@ def create_model_table_data():
    all_unit_data.update(units_data['flow_units'])
    all_unit_data.update(units_data['basic_units'])
 
-   units = {}
-   for name, details in all_unit_data.items():
-       units[name], _ = MeasurementUnit.objects.update_or_create(
+   # Upsert all units in one statement
+   unit_objects = [
+       MeasurementUnit(
            type=details['type'],
            name=name,
-           defaults={
-               'description': details['description'],
-               'conversion_factor': details['conversion_factor'],
-               'is_base_unit': details['is_base_unit']
-           }
+           description=details['description'],
+           conversion_factor=details['conversion_factor'],
+           is_base_unit=details['is_base_unit']
        )
+       for name, details in all_unit_data.items()
+   ]
+   MeasurementUnit.objects.bulk_create(
+       unit_objects,
+       update_conflicts=True,
+       unique_fields=['type', 'name'],
+       update_fields=['description', 'conversion_factor', 'is_base_unit']
+   )
+   units = dict(zip(all_unit_data, unit_objects))
 
-   # Create Projects with get_or_create
+   # Create Projects
    projects_data = {
        'audit': {
            'name': "Energy Trust Production",
@@ -266,17 +292,24 @@ def create_model_table_data():
        }
    }
 
-   projects = {}
-   for key, details in projects_data.items():
-        projects[key], _ = Project.objects.get_or_create(
-            name=details['name'],
-            project_type=details['project_type'],
-            defaults={
-                'start_date': details.get('start_date'),
-                'end_date': details.get('end_date'),
-                'owner': test_user  # ✅ Ensure the project has an owner
-            }
-        )
+   # Upsert all projects in one statement
+   project_objects = [
+       Project(
+           name=details['name'],
+           project_type=details['project_type'],
+           start_date=details.get('start_date'),
+           end_date=details.get('end_date'),
+           owner=test_user  # ✅ Ensure the project has an owner
+       )
+       for details in projects_data.values()
+   ]
+   Project.objects.bulk_create(
+       project_objects,
+       update_conflicts=True,
+       unique_fields=['name', 'owner'],
+       update_fields=['project_type', 'start_date', 'end_date']
+   )
+   projects = dict(zip(projects_data, project_objects))
 
    # Create Locations with get_or_create
    locations_data = {
@@ -308,7 +341,7 @@ def create_model_table_data():
            }
        )
 
-   # Create Measurements with get_or_create
+   # Create Measurements
    measurements_data = {
        'pressure': {
            'name': "Building Pressure",
@@ -336,18 +369,25 @@ def create_model_table_data():
        }
    }
 
-   measurements = {}
-   for key, details in measurements_data.items():
-       measurements[key], _ = Measurement.objects.get_or_create(
+   # Upsert all measurements in one statement
+   measurement_objects = [
+       Measurement(
            name=details['name'],
+           description=details['description'],
            location=details['location'],
            type=details['type'],
            unit=details['unit'],
-           defaults={
-               'description': details['description'],
-               'multiplier': details['multiplier']
-           }
+           multiplier=details['multiplier']
        )
+       for details in measurements_data.values()
+   ]
+   Measurement.objects.bulk_create(
+       measurement_objects,
+       update_conflicts=True,
+       unique_fields=['name', 'location'],
+       update_fields=['description', 'type', 'unit', 'multiplier']
+   )
+   measurements = dict(zip(measurements_data, measurement_objects))
 
    # Create Data Sources
    sources_data = {
@@ -384,12 +424,14 @@ def create_model_table_data():
             }
         )
 
-   # Create DataSourceLocation links
-   for location in locations.values():
-       DataSourceLocation.objects.get_or_create(
-           data_source=sources['niagara'],
-           location=location
-       )
+   # Create DataSourceLocation links, skipping any that already exist
+   DataSourceLocation.objects.bulk_create(
+       [
+           DataSourceLocation(data_source=sources['niagara'], location=location)
+           for location in locations.values()
+       ],
+       ignore_conflicts=True
+   )
 
    # Create Dataset and mappings
    dataset, _ = Dataset.objects.get_or_create(
@@ -413,17 +455,20 @@ def create_model_table_data():
        }
    )
 
-   # Create or update time series data
+   # Create time series data in one insert, keeping any existing points
    now = datetime.datetime.now(datetime.timezone.utc)
-   for i in range(24):  # 24 hours of data
-        TimeSeriesData.objects.get_or_create(
-            timestamp=now - datetime.timedelta(hours=i),
-            measurement=measurements['pressure'],
-            dataset=dataset,  # ✅ Ensure dataset_id is assigned
-            defaults={
-                'value': round(random.uniform(-0.1, 0.1), 3)
-            }
-        )
+   TimeSeriesData.objects.bulk_create(
+       [
+           TimeSeriesData(
+               timestamp=now - datetime.timedelta(hours=i),
+               measurement=measurements['pressure'],
+               dataset=dataset,  # ✅ Ensure dataset_id is assigned
+               value=round(random.uniform(-0.1, 0.1), 3)
+           )
+           for i in range(24)  # 24 hours of data
+       ],
+       ignore_conflicts=True
+   )
 
    return "Test data created successfully"
 
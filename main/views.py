@@ -249,7 +249,8 @@ class ProjectViewSet(TreeNodeViewSet):
         if self.select_related_fields:
             queryset = queryset.select_related(*self.select_related_fields)
         
-        if self.action != 'list' and self.prefetch_related_fields:
+        # ProjectSerializer nests locations and access, so list needs them too
+        if self.prefetch_related_fields:
             queryset = queryset.prefetch_related(*self.prefetch_related_fields)
 
         return queryset.distinct()
@@ -601,7 +602,8 @@ class MeasurementTypeViewSet(viewsets.ReadOnlyModelViewSet):
 class MeasurementViewSet(TreeNodeViewSet):
     serializer_class = MeasurementSerializer
     queryset = Measurement.objects.all()
-    select_related_fields = ['type', 'unit', 'location', 'location__project']
+    # type__category feeds MeasurementSerializer.get_category
+    select_related_fields = ['type__category', 'unit', 'location', 'location__project']
     children_attr = None  # Measurements are leaf nodes
     filter_fields = {
         'name': 'name__icontains',
@@ -6,7 +6,11 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ecam_web.settings')
+    # Commands that run the test suite get the test settings
+    test_commands = ('test', 'run_tests_with_dependencies')
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    settings_module = 'ecam_web.settings_test' if command in test_commands else 'ecam_web.settings'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc: